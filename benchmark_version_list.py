@@ -0,0 +1,94 @@
+"""
+Benchmark for the virtualized version list in td_launcher.py.
+
+td_launcher.py builds its GUI at import time, so this pulls just the list functions out of the
+source and runs them against synthetic TouchDesigner keys with the DearPyGui calls stubbed out.
+The per keystroke cost should stay flat as the number of installed builds grows.
+
+usage: python benchmark_version_list.py [num_keys ...]      (defaults to 1000 and 10000)
+"""
+import ast
+import logging
+import os
+import sys
+import time
+
+list_functions = {
+    '_parse_td_key_numeric',
+    '_version_search_tokens',
+    'build_version_prefix_index',
+    'filter_version_keys',
+    'clamp_version_list_offset',
+    'scroll_selection_into_view',
+    'refresh_version_list',
+    'select_version_index',
+    'on_version_filter_changed',
+    'move_selection',
+    'scroll_version_list',
+}
+
+class StubDpg:
+    # counts the GUI calls the list makes instead of drawing anything.
+    def __init__(self):
+        self.calls = 0
+
+    def does_item_exist(self, tag):
+        return True
+
+    def configure_item(self, *args, **kwargs):
+        self.calls += 1
+
+    def set_value(self, *args, **kwargs):
+        self.calls += 1
+
+def load_list_functions():
+    launcher_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'td_launcher.py')
+    with open(launcher_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    nodes = [ n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name in list_functions ]
+    namespace = { 'dpg': StubDpg(), 'logger': logging.getLogger('benchmark') }
+    exec(compile(ast.Module(nodes, []), launcher_path, 'exec'), namespace)
+    return namespace
+
+def synthetic_keys(num_keys: int):
+    return [ f'TouchDesigner.{2017 + i % 9}.{10000 + i}' for i in range(num_keys) ]
+
+def benchmark(num_keys: int, num_moves=1000):
+    ns = load_list_functions()
+    keys = sorted(synthetic_keys(num_keys), key=ns['_parse_td_key_numeric'])
+
+    started = time.perf_counter()
+    ns['version_keys'] = keys
+    ns['version_prefix_index'] = ns['build_version_prefix_index'](keys)
+    index_seconds = time.perf_counter() - started
+
+    ns.update(
+        version_list_visible_rows = 9,
+        filtered_version_keys = list(keys),
+        filtered_version_positions = { k:i for i,k in enumerate(keys) },
+        selected_version_key = keys[0],
+        selected_version_index = 0,
+        version_list_offset = 0,
+    )
+
+    stub = ns['dpg']
+    stub.calls = 0
+    started = time.perf_counter()
+    for _ in range(num_moves):
+        ns['move_selection'](1)
+    move_seconds = (time.perf_counter() - started) / num_moves
+    calls_per_move = stub.calls / num_moves
+
+    queries = [ '2', '20', '202', '2023', '2023.', '2023.1', '2023.10', '2023.100', '' ]
+    started = time.perf_counter()
+    for query in queries:
+        ns['on_version_filter_changed'](None, query)
+    filter_seconds = (time.perf_counter() - started) / len(queries)
+
+    print(f'{num_keys:>6} keys | index build {index_seconds * 1e3:7.1f} ms | '
+          f'arrow key {move_seconds * 1e6:6.1f} us ({calls_per_move:.0f} gui calls) | '
+          f'filter keystroke {filter_seconds * 1e3:6.2f} ms')
+
+if __name__ == '__main__':
+    for n in [ int(a) for a in sys.argv[1:] ] or [ 1000, 10000 ]:
+        benchmark(n)
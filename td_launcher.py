@@ -9,11 +9,32 @@ import urllib.request
 import platform
 import plistlib
 import glob
+import math
 import logging
+import logging.handlers
+import collections
+import atexit
+import json
+import tempfile
+import threading
+import queue
 
 # Platform-specific imports
 if platform.system() == 'Windows':
     import winreg
+    import ctypes
+    from ctypes import wintypes
+
+    # process affinity for launch profiles, use_last_error so failures can say why.
+    PROCESS_SET_INFORMATION = 0x0200
+    PROCESS_QUERY_INFORMATION = 0x0400
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.SetProcessAffinityMask.argtypes = (wintypes.HANDLE, ctypes.c_size_t)
+    kernel32.SetProcessAffinityMask.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
 
 app_version = '1.1.0'
 
@@ -22,23 +43,103 @@ app_version = '1.1.0'
 is_app_bundle = '/Contents/MacOS' in os.path.abspath(__file__) or os.getcwd() == '/'
 DEBUG_MODE = os.environ.get('TD_LAUNCHER_DEBUG', '').lower() in ('1', 'true', 'yes')
 
+def _user_log_directory():
+    # a per user location that exists and is writable no matter how the launcher was started
+    # (file associations on Windows start us in unpredictable working directories).
+    if platform.system() == 'Windows' and os.environ.get('LOCALAPPDATA'):
+        return os.path.join(os.environ['LOCALAPPDATA'], 'TD Launcher', 'Logs')
+    if platform.system() == 'Darwin':
+        return os.path.expanduser('~/Library/Logs/TD Launcher')
+    if platform.system() == 'Windows':
+        return os.path.join(tempfile.gettempdir(), 'TD Launcher')
+    return os.path.join(os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state'), 'td_launcher')
+
+log_file = os.path.join(_user_log_directory(), 'td_launcher_debug.log')
+log_buffer_capacity = 2000
+log_file_max_bytes = 1024 * 1024
+log_file_backup_count = 3
+
+class RingBufferHandler(logging.Handler):
+    # Keeps the last `capacity` records in memory without formatting them, and only hands them to
+    # `target` when a record at `flush_level` or above comes in, or when dump() is called explicitly.
+    # A good launch never formats a debug message or touches the disk.
+    def __init__(self, capacity, target, flush_level=logging.ERROR):
+        super().__init__(level=logging.DEBUG)
+        self.records = collections.deque(maxlen=capacity)
+        self.target = target
+        self.flush_level = flush_level
+
+    def emit(self, record):
+        self.records.append(record)
+        if record.levelno >= self.flush_level:
+            self.dump()
+
+    def dump(self):
+        # returns True once the records have been written. If the log file can't be opened they stay buffered.
+        self.acquire()
+        try:
+            try:
+                # private to the user, nobody else gets to plant files or symlinks next to the log.
+                os.makedirs(os.path.dirname(self.target.baseFilename), mode=0o700, exist_ok=True)
+                # make sure the file can be appended to before handing over records the target would otherwise drop.
+                with open(self.target.baseFilename, 'a', encoding='utf-8'):
+                    pass
+            except OSError as e:
+                sys.stderr.write(f"Could not write log file {self.target.baseFilename}: {e}\n")
+                return False
+            while self.records:
+                self.target.handle(self.records.popleft())
+            self.target.flush()
+            return True
+        finally:
+            self.release()
+
+# none of these end up in our log format, so don't pay to collect them on every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+log_formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s')
+
+# delay=True, so the log file is only created the first time something is actually flushed to it.
+log_file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=log_file_max_bytes, backupCount=log_file_backup_count, delay=True, encoding='utf-8')
+log_file_handler.setFormatter(log_formatter)
+log_buffer_handler = RingBufferHandler(log_buffer_capacity, log_file_handler)
+
+console_handler = logging.StreamHandler(sys.stdout if DEBUG_MODE else sys.stderr)
+console_handler.setLevel(logging.DEBUG if DEBUG_MODE else logging.WARNING)
+console_handler.setFormatter(log_formatter if DEBUG_MODE else logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+
+logging.basicConfig(level=logging.DEBUG, handlers=[ log_buffer_handler, console_handler ])
+
+class LazyLogArg:
+    # defers an expensive log argument until the record is actually formatted, which for
+    # buffered records only happens when they are written out.
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+def dump_log_buffer():
+    if log_buffer_handler.dump():
+        print(f"📝 Saved diagnostics to {log_file}")
+
+def _log_uncaught_exception(exc_type, exc_value, exc_traceback):
+    if not issubclass(exc_type, KeyboardInterrupt):
+        logging.getLogger(__name__).critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
+    sys.__excepthook__(exc_type, exc_value, exc_traceback)
+
+sys.excepthook = _log_uncaught_exception
+
 if DEBUG_MODE:
-    # For app bundles, write log to a location we can access
-    log_file = os.path.expanduser('~/Desktop/td_launcher_debug.log') if is_app_bundle else 'td_launcher_debug.log'
-    
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='[%(asctime)s] %(levelname)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file)
-        ]
-    )
-    print(f"🐛 DEBUG MODE ENABLED - Logging to console and {log_file}")
+    atexit.register(log_buffer_handler.dump)
+    print(f"🐛 DEBUG MODE ENABLED - Logging to console, saving to {log_file} on exit")
     if is_app_bundle:
         print(f"📱 Running as app bundle - debug log: {log_file}")
-else:
-    logging.basicConfig(level=logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
@@ -62,22 +163,19 @@ download_progress = 0.0
 should_exit = False  # Global flag for graceful shutdown on macOS
 
 # Essential startup logging only
-logger.info(f"TD Launcher v{app_version} starting...")
-if DEBUG_MODE:
-    logger.debug(f"Command line args: {sys.argv}")
-    logger.debug(f"Working directory: {os.getcwd()}")
-    logger.debug(f"Platform: {platform.system()} {platform.release()}")
+logger.info("TD Launcher v%s starting...", app_version)
+logger.debug("Command line args: %s", sys.argv)
+logger.debug("Working directory: %s", os.getcwd())
+logger.debug("Platform: %s %s", platform.system(), platform.release())
 
 if len(sys.argv) >= 2:
     td_file_path = sys.argv[1] # this gets passed in as argument
-    if DEBUG_MODE:
-        logger.debug(f"File path from command line: {td_file_path}")
+    logger.debug("File path from command line: %s", td_file_path)
     
     # Convert to absolute path to avoid working directory issues
     if not os.path.isabs(td_file_path):
         td_file_path = os.path.abspath(td_file_path)
-        if DEBUG_MODE:
-            logger.debug(f"Converted to absolute path: {td_file_path}")
+        logger.debug("Converted to absolute path: %s", td_file_path)
 else:
     # No command line argument - this is the file association issue
     if is_app_bundle:
@@ -96,20 +194,18 @@ else:
         
         # Use bundled test file as absolute fallback
         td_file_path = os.path.join(current_directory, 'test.toe')
-        logger.warning(f"Using bundled test file as fallback: {td_file_path}")
+        logger.warning("Using bundled test file as fallback: %s", td_file_path)
     else:
         td_file_path = os.path.join(current_directory, 'test.toe')
-        if DEBUG_MODE:
-            logger.debug(f"Using default test file: {td_file_path}")
+        logger.debug("Using default test file: %s", td_file_path)
 
 # Validate the file path
 if not os.path.exists(td_file_path):
-    logger.error(f"File does not exist: {td_file_path}")
-    logger.error(f"Directory contents of parent: {os.listdir(os.path.dirname(td_file_path)) if os.path.exists(os.path.dirname(td_file_path)) else 'Parent directory does not exist'}")
+    logger.error("File does not exist: %s", td_file_path)
+    logger.error("Directory contents of parent: %s", os.listdir(os.path.dirname(td_file_path)) if os.path.exists(os.path.dirname(td_file_path)) else 'Parent directory does not exist')
     print(f"❌ Error: File not found: {td_file_path}")
 else:
-    if DEBUG_MODE:
-        logger.debug(f"Target file exists: {td_file_path} (size: {os.path.getsize(td_file_path)} bytes)")
+    logger.debug("Target file exists: %s (size: %s bytes)", td_file_path, LazyLogArg(os.path.getsize, td_file_path))
 
 def query_td_registry_entries():
     # scan the registry and store any keys we find along the way that contain the string "TouchDesigner"
@@ -140,17 +236,15 @@ def query_td_registry_entries():
 
 def query_td_mac_applications():
     """Mac version: scan /Applications for TouchDesigner apps and extract version info from Info.plist"""
-    if DEBUG_MODE:
-        logger.debug("Scanning for TouchDesigner applications...")
+    logger.debug("Scanning for TouchDesigner applications...")
     td_matching_apps = []
     applications_dir = "/Applications"
     
     # Look for TouchDesigner applications
     td_pattern = os.path.join(applications_dir, "TouchDesigner*")
-    logger.debug(f"Searching pattern: {td_pattern}")
+    logger.debug("Searching pattern: %s", td_pattern)
     td_apps = glob.glob(td_pattern)
-    if DEBUG_MODE:
-        logger.debug(f"Found {len(td_apps)} potential TouchDesigner apps")
+    logger.debug("Found %s potential TouchDesigner apps", len(td_apps))
     
     td_key_id_dict = {}
     
@@ -160,8 +254,7 @@ def query_td_mac_applications():
             
         app_name = os.path.basename(app_path)
         info_plist_path = os.path.join(app_path, "Contents", "Info.plist")
-        logger.debug(f"Processing app: {app_name}")
-        logger.debug(f"Info.plist path: {info_plist_path}")
+        logger.debug("Processing app: %s (%s)", app_name, info_plist_path)
         
         try:
             # Read the Info.plist file
@@ -171,7 +264,6 @@ def query_td_mac_applications():
             # Extract version information
             bundle_version = plist_data.get('CFBundleVersion', '')
             bundle_name = plist_data.get('CFBundleName', app_name)
-            logger.debug(f"Bundle version: {bundle_version}, Bundle name: {bundle_name}")
             
             if bundle_version:
                 # Create a key in the format TouchDesigner.VERSION.BUILD
@@ -190,15 +282,14 @@ def query_td_mac_applications():
                         'app_path': app_path,
                         'bundle_version': bundle_version
                     }
-                    if DEBUG_MODE:
-                        logger.debug(f"Found TouchDesigner: {td_key} at {executable_path}")
+                    logger.debug("Found TouchDesigner: %s (%s, bundle version %s) at %s", td_key, bundle_name, bundle_version, executable_path)
                 else:
-                    logger.warning(f"Could not parse version from {bundle_version}")
+                    logger.warning("Could not parse version from %s", bundle_version)
             else:
-                logger.warning(f"No bundle version found for {app_name}")
+                logger.warning("No bundle version found for %s", app_name)
                     
         except (FileNotFoundError, plistlib.InvalidFileException, KeyError) as e:
-            logger.error(f"Could not read Info.plist for {app_path}: {e}")
+            logger.error("Could not read Info.plist for %s: %s", app_path, e)
             print(f"Could not read Info.plist for {app_path}: {e}")
             continue
     
@@ -253,7 +344,7 @@ def inspect_toe_v2():
     # Cross-platform path handling
     if platform.system() == 'Windows':
         toeexpand_path = os.path.join(current_directory, "toeexpand", "toeexpand.exe")
-        logger.debug(f"Using Windows toeexpand: {toeexpand_path}")
+        logger.debug("Using Windows toeexpand: %s", toeexpand_path)
     else:  # Mac/Linux
         # For Mac, we'll use toeexpand from the first available TouchDesigner installation
         logger.debug("Looking for toeexpand in TouchDesigner installations...")
@@ -263,24 +354,22 @@ def inspect_toe_v2():
             first_app = list(td_apps.values())[0]
             app_path = first_app['app_path']
             toeexpand_path = os.path.join(app_path, "Contents", "MacOS", "toeexpand")
-            if DEBUG_MODE:
-                logger.debug(f"Using toeexpand from: {app_path}")
-            logger.debug(f"Toeexpand path: {toeexpand_path}")
+            logger.debug("Using toeexpand from: %s", app_path)
+            logger.debug("Toeexpand path: %s", toeexpand_path)
         else:
             logger.error("❌ No TouchDesigner installation found for toeexpand")
             raise FileNotFoundError("No TouchDesigner installation found for toeexpand")
     
     # Check if toeexpand exists
     if not os.path.exists(toeexpand_path):
-        logger.error(f"❌ toeexpand not found at: {toeexpand_path}")
+        logger.error("❌ toeexpand not found at: %s", toeexpand_path)
         raise FileNotFoundError(f"toeexpand not found at: {toeexpand_path}")
     
     # Use cross-platform path
     command = f'"{toeexpand_path}" -b "{td_file_path}"'
-    logger.debug(f"Running command: {command}")
+    logger.debug("Running command: %s", command)
 
-    if DEBUG_MODE:
-        logger.debug("Running toeexpand to analyze TOE file...")
+    logger.debug("Running toeexpand to analyze TOE file...")
     
     process = subprocess.Popen(command, shell = True, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
     out, err = process.communicate() # this is a blocking call, it will wait until the subprocess is finished.
@@ -289,53 +378,53 @@ def inspect_toe_v2():
     raw_output = out.decode('utf-8')
     raw_error = err.decode('utf-8')
     
-    logger.debug(f"toeexpand stdout: {repr(raw_output)}")
+    logger.debug("toeexpand stdout: %r", raw_output)
     if raw_error:
-        logger.warning(f"toeexpand stderr: {repr(raw_error)}")
+        logger.warning("toeexpand stderr: %r", raw_error)
     
     if process.returncode != 0:
-        logger.info(f"⚠️  toeexpand returned exit code {process.returncode} (this is often normal)")
+        logger.info("⚠️  toeexpand returned exit code %s (this is often normal)", process.returncode)
         if raw_error:
-            logger.debug(f"Error output: {raw_error}")
+            logger.debug("Error output: %s", raw_error)
         # Don't fail immediately - toeexpand often returns 1 even with valid output
     
     build_info = raw_output # convert the output to a string.
 
     # strip \r from the build_info string.
     build_info = build_info.replace('\r','')
-    logger.debug(f"Cleaned build_info: {repr(build_info)}")
+    logger.debug("Cleaned build_info: %r", build_info)
 
     # Check if we have any useful output at all
     if not build_info or len(build_info.strip()) < 5:
-        logger.error(f"❌ toeexpand produced no useful output")
-        logger.error(f"stdout: {repr(raw_output)}")
-        logger.error(f"stderr: {repr(raw_error)}")
+        logger.error("❌ toeexpand produced no useful output")
+        logger.error("stdout: %r", raw_output)
+        logger.error("stderr: %r", raw_error)
         raise RuntimeError(f"toeexpand failed to produce output: {raw_error}")
 
     info_split = build_info.split('\n') # split the string into a list.
-    logger.debug(f"Split info: {info_split}")
+    logger.debug("Split info: %s", info_split)
     
     # Filter out empty lines
     info_split = [line.strip() for line in info_split if line.strip()]
-    logger.debug(f"Filtered info: {info_split}")
+    logger.debug("Filtered info: %s", info_split)
     
     if len(info_split) < 2:
-        logger.error(f"❌ Unexpected toeexpand output format - need at least 2 lines")
-        logger.error(f"Got: {info_split}")
+        logger.error("❌ Unexpected toeexpand output format - need at least 2 lines")
+        logger.error("Got: %s", info_split)
         raise ValueError(f"Unexpected toeexpand output format: {info_split}")
 
     try:
         version_line = info_split[1]
-        logger.debug(f"Version line: {version_line}")
+        logger.debug("Version line: %s", version_line)
         version_number = version_line.split(" ")[-1]
         build_option = f'TouchDesigner.{version_number}'
         
-        logger.info(f"TOE file requires TouchDesigner {build_option}")
+        logger.info("TOE file requires TouchDesigner %s", build_option)
         
         return build_option
     except (IndexError, AttributeError) as e:
-        logger.error(f"❌ Failed to parse version from toeexpand output: {e}")
-        logger.error(f"Raw output was: {repr(build_info)}")
+        logger.error("❌ Failed to parse version from toeexpand output: %s", e)
+        logger.error("Raw output was: %r", build_info)
         raise ValueError(f"Failed to parse version from toeexpand output: {e}")
 
 
@@ -392,6 +481,407 @@ def generate_td_url(build_option):
     return url
 
 
+# Launch profiles let one .toe be started as several TouchDesigner instances with their own cpu set,
+# priority and start stagger. A profile is a json file next to the .toe (or pointed to by TD_LAUNCHER_PROFILE):
+# {
+#     "instances": [ {"cpus": "0-7", "nice": -5}, {"cpus": "8-15", "nice": 5} ],   # or just a count, e.g. 4
+#     "cpus": "auto",             # optional, split the available cpus evenly between instances without their own "cpus"
+#     "nice": 0,                  # optional, default priority for instances without their own "nice"
+#     "stagger_seconds": 2.0,     # optional, delay between starting consecutive instances
+#     "record_load_times": true,  # optional, wait for each instance to report ready and log how long it took
+#     "load_timeout_seconds": 120
+# }
+launch_profile_filename = 'td_launcher_profile.json'
+load_times_filename = 'td_launcher_load_times.jsonl'
+max_profile_instances = os.cpu_count() or 1
+
+def _profile_seconds(profile, key, default):
+    value = float(profile.get(key, default))
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(f"'{key}' must be a finite number of seconds >= 0, got {value!r}")
+    return value
+
+def load_launch_profile(toe_path):
+    profile_path = os.environ.get('TD_LAUNCHER_PROFILE', '')
+    if profile_path and not os.path.isfile(profile_path):
+        logger.warning("TD_LAUNCHER_PROFILE is set but %s does not exist, launching normally", profile_path)
+        return None
+    profile_path = profile_path or os.path.join(os.path.dirname(os.path.abspath(toe_path)), launch_profile_filename)
+    if not os.path.isfile(profile_path):
+        return None
+
+    try:
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error("❌ Could not read launch profile %s: %s", profile_path, e)
+        return None
+
+    if not isinstance(profile, dict):
+        logger.error("❌ Launch profile %s: expected a json object at the top level", profile_path)
+        return None
+
+    instances = profile.get('instances', 1)
+    if isinstance(instances, int) and not isinstance(instances, bool) and instances >= 1:
+        instances = [ {} for _ in range(instances) ]
+    if not isinstance(instances, list) or not instances or not all(isinstance(i, dict) for i in instances):
+        logger.error("❌ Launch profile %s: 'instances' must be a number >= 1 or a non empty list of objects", profile_path)
+        return None
+    if len(instances) > max_profile_instances:
+        # most likely a typo, starting hundreds of TouchDesigner processes is never what anybody wants.
+        logger.error("❌ Launch profile %s: %s instances requested, at most %s (one per cpu) are allowed", profile_path, len(instances), max_profile_instances)
+        return None
+
+    # fill in the per instance cpu sets and priorities from the profile level defaults.
+    try:
+        auto_cpu_sets = split_cpus_evenly(len(instances)) if profile.get('cpus') == 'auto' else None
+        for i, instance in enumerate(instances):
+            if 'cpus' not in instance and auto_cpu_sets:
+                instance['cpus'] = auto_cpu_sets[i]
+            elif 'cpus' not in instance and 'cpus' in profile and profile['cpus'] != 'auto':
+                instance['cpus'] = profile['cpus']
+            if 'cpus' in instance:
+                instance['cpus'] = parse_cpu_set(instance['cpus'])
+            instance['nice'] = int(instance.get('nice', profile.get('nice', 0)))
+            if not -20 <= instance['nice'] <= 19:
+                raise ValueError(f"'nice' must be between -20 and 19, got {instance['nice']}")
+        profile['stagger_seconds'] = _profile_seconds(profile, 'stagger_seconds', 0)
+        profile['load_timeout_seconds'] = _profile_seconds(profile, 'load_timeout_seconds', 120)
+    except (ValueError, TypeError) as e:
+        logger.error("❌ Launch profile %s: invalid value: %s", profile_path, e)
+        return None
+
+    profile['instances'] = instances
+    profile['path'] = profile_path
+    logger.info("Using launch profile %s (%s instance(s))", profile_path, len(instances))
+    return profile
+
+def parse_cpu_set(cpus):
+    # accepts a list of cpu numbers or a linux style cpu list string like "0-3,8,10-11"
+    # raises ValueError for anything that isn't a non empty set of cpu numbers.
+    cpu_set = set()
+    if isinstance(cpus, (list, tuple, set)):
+        cpu_set.update(int(c) for c in cpus)
+    else:
+        for part in str(cpus).split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                first, last = part.split('-', 1)
+                cpu_set.update(range(int(first), int(last) + 1))
+            else:
+                cpu_set.add(int(part))
+
+    if not cpu_set or min(cpu_set) < 0:
+        raise ValueError(f"bad cpu set {cpus!r}")
+    if platform.system() == 'Windows' and max(cpu_set) >= 64:
+        # SetProcessAffinityMask only reaches the first processor group.
+        raise ValueError(f"cpu set {cpus!r} goes beyond cpu 63, processor groups are not supported")
+    return sorted(cpu_set)
+
+def split_cpus_evenly(num_instances: int):
+    # contiguous blocks, so that on multi socket machines an instance tends to stay on one NUMA node.
+    if hasattr(os, 'sched_getaffinity'):
+        available = sorted(os.sched_getaffinity(0))
+    else:
+        available = list(range(os.cpu_count() or 1))
+    if num_instances > len(available):
+        logger.warning("%s instances but only %s cpus available, some instances will share a cpu", num_instances, len(available))
+        return [ [ available[i % len(available)] ] for i in range(num_instances) ]
+
+    # spread the remainder over the first blocks, so no cpu is left unused.
+    block, remainder = divmod(len(available), num_instances)
+    cpu_sets = []
+    start = 0
+    for i in range(num_instances):
+        end = start + block + (1 if i < remainder else 0)
+        cpu_sets.append(available[start:end])
+        start = end
+    return cpu_sets
+
+def _windows_priority_class(nice: int):
+    # map unix style nice values onto the windows process priority classes.
+    if nice <= -10:
+        return subprocess.HIGH_PRIORITY_CLASS
+    if nice < 0:
+        return subprocess.ABOVE_NORMAL_PRIORITY_CLASS
+    if nice == 0:
+        return 0
+    if nice < 10:
+        return subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    return subprocess.IDLE_PRIORITY_CLASS
+
+def _set_windows_affinity(pid, cpus):
+    # returns None on success, otherwise the windows error explaining why it failed.
+    handle = kernel32.OpenProcess(PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION, False, pid)
+    if not handle:
+        return ctypes.FormatError(ctypes.get_last_error())
+    try:
+        if not kernel32.SetProcessAffinityMask(handle, sum(1 << c for c in cpus)):
+            return ctypes.FormatError(ctypes.get_last_error())
+        return None
+    finally:
+        kernel32.CloseHandle(handle)
+
+def _spawn_from_scheduled_thread(command, env, cpus, nice):
+    # on Linux cpu affinity and nice belong to the calling thread and are inherited through fork, so they are
+    # set on a throwaway thread that then does the spawn. TouchDesigner starts with them before its first
+    # instruction and the launcher's own threads are left untouched.
+    result = {}
+
+    def spawn():
+        tid = threading.get_native_id()
+        if cpus:
+            try:
+                os.sched_setaffinity(tid, cpus)
+            except OSError as e:
+                logger.warning("Could not set cpu affinity %s: %s", cpus, e)
+        if nice:
+            try:
+                os.setpriority(os.PRIO_PROCESS, tid, nice)
+            except OSError as e:
+                logger.warning("Could not set nice %s: %s", nice, e)
+        try:
+            result['process'] = subprocess.Popen(command, env=env)
+        except OSError as e:
+            result['error'] = e
+
+    spawner = threading.Thread(target=spawn, name='td_launch_spawn')
+    spawner.start()
+    spawner.join()
+    if 'error' in result:
+        raise result['error']
+    return result['process']
+
+def spawn_td_instance(executable_path, toe_path, instance, env):
+    # a failure to apply the cpu set or priority only costs the tuning, never the launch.
+    cpus = instance.get('cpus')
+    nice = instance.get('nice', 0)
+    command = [executable_path, toe_path]
+
+    if platform.system() == 'Windows':
+        process = subprocess.Popen(command, env=env, creationflags=_windows_priority_class(nice))
+        if cpus:
+            error = _set_windows_affinity(process.pid, cpus)
+            if error:
+                logger.warning("Could not set cpu affinity %s for PID %s: %s", cpus, process.pid, error)
+        return process
+
+    if platform.system() == 'Linux':
+        return _spawn_from_scheduled_thread(command, env, cpus, nice)
+
+    # macOS has no cpu affinity, and its nice is per process, so it is set on the child right after the spawn.
+    if cpus:
+        logger.warning("cpu affinity is not supported on %s, ignoring cpus %s", platform.system(), cpus)
+    process = subprocess.Popen(command, env=env)
+    if nice:
+        try:
+            os.setpriority(os.PRIO_PROCESS, process.pid, nice)
+        except OSError as e:
+            logger.warning("Could not set nice %s for PID %s: %s", nice, process.pid, e)
+    return process
+
+def launch_instances_with_profile(executable_path, toe_path, profile):
+    # the stagger and the load time polling can take minutes, so they run on a worker thread instead of
+    # blocking the GUI. It is not a daemon, so the launcher process stays around until it has finished.
+    worker = threading.Thread(target=_launch_instances, args=(executable_path, toe_path, profile), name='td_launch_profile')
+    worker.start()
+    return worker
+
+def _launch_instances(executable_path, toe_path, profile):
+    # every instance gets its index and a ready file path in its environment. A project can touch
+    # TD_LAUNCHER_READY_FILE once it has finished loading (e.g. from an onStart callback) to report its load time.
+    stagger_seconds = profile['stagger_seconds']
+    record_load_times = bool(profile.get('record_load_times', False))
+    launched = []
+
+    for index, instance in enumerate(profile['instances']):
+        if index and stagger_seconds > 0:
+            time.sleep(stagger_seconds)
+
+        ready_file = os.path.join(tempfile.gettempdir(), f'td_launcher_ready_{os.getpid()}_{index}')
+        if os.path.exists(ready_file):
+            os.remove(ready_file)
+        env = dict(os.environ, TD_LAUNCHER_INSTANCE=str(index), TD_LAUNCHER_READY_FILE=ready_file)
+
+        started = time.time()
+        try:
+            process = spawn_td_instance(executable_path, toe_path, instance, env)
+        except OSError as e:
+            logger.error("❌ Failed to start instance %s: %s", index, e)
+            continue
+        logger.info("✅ Instance %s started with PID: %s (cpus: %s, nice: %s)", index, process.pid, instance.get('cpus', 'all'), instance['nice'])
+        launched.append({ 'index': index, 'process': process, 'started': started, 'ready_file': ready_file, 'instance': instance })
+
+    if record_load_times and launched:
+        record_instance_load_times(launched, toe_path, profile)
+
+def record_instance_load_times(launched, toe_path, profile):
+    timeout = profile['load_timeout_seconds']
+    deadline = time.time() + timeout
+    pending = list(launched)
+    records = []
+
+    # status is "ready" with a load_time, or "exited" (with its exit code) / "timeout" without one,
+    # so a build that crashes at startup never shows up as a fast load.
+    logger.info("⏱️  Waiting up to %.0fs for %s instance(s) to report ready...", timeout, len(pending))
+    while pending and time.time() < deadline:
+        for l in list(pending):
+            if os.path.exists(l['ready_file']):
+                load_time = os.path.getmtime(l['ready_file']) - l['started']
+                os.remove(l['ready_file'])
+                records.append(( l, 'ready', round(max(load_time, 0), 3), None ))
+            elif l['process'].poll() is not None:
+                records.append(( l, 'exited', None, l['process'].returncode ))
+            else:
+                continue
+            pending.remove(l)
+        time.sleep(0.05)
+    records += [ (l, 'timeout', None, None) for l in pending ]
+
+    log_path = os.path.join(os.path.dirname(profile['path']), load_times_filename)
+    try:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            for l, status, load_time, exit_code in sorted(records, key=lambda r: r[0]['index']):
+                if status == 'ready':
+                    logger.info("⏱️  Instance %s load time: %s", l['index'], load_time)
+                elif status == 'exited':
+                    logger.warning("Instance %s exited with code %s before reporting ready", l['index'], exit_code)
+                else:
+                    logger.warning("Instance %s did not report ready within %.0fs", l['index'], timeout)
+                f.write(json.dumps({
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(l['started'])),
+                    'toe': toe_path,
+                    'instance': l['index'],
+                    'pid': l['process'].pid,
+                    'cpus': l['instance'].get('cpus'),
+                    'nice': l['instance']['nice'],
+                    'stagger_seconds': profile['stagger_seconds'],
+                    'status': status,
+                    'load_time': load_time,
+                    'exit_code': exit_code,
+                }) + '\n')
+    except OSError as e:
+        logger.warning("Could not write load times to %s: %s", log_path, e)
+
+
+# Page cache prewarming: while the countdown runs, ask the OS to pull the .toe and its asset directories
+# into the page cache so TouchDesigner doesn't start cold. Asset directories are listed (relative to the .toe)
+# in TD_LAUNCHER_PREWARM_DIRS separated by os.pathsep, and TD_LAUNCHER_PREWARM_MB caps how much gets read.
+prewarm_dirs = [ d for d in os.environ.get('TD_LAUNCHER_PREWARM_DIRS', '').split(os.pathsep) if d.strip() ]
+prewarm_default_budget_mb = 1024
+prewarm_num_workers = 4
+prewarm_chunk_size = 1024 * 1024
+prewarm_min_remaining_bytes = 64 * 1024
+prewarm_cancel_event = threading.Event()
+
+def _parse_prewarm_budget():
+    # prewarming is only an optimization, so a bad setting falls back to the default rather than stopping the launch.
+    value = os.environ.get('TD_LAUNCHER_PREWARM_MB', '')
+    try:
+        budget_mb = float(value) if value.strip() else prewarm_default_budget_mb
+        if not 0 <= budget_mb < float('inf'):
+            raise ValueError(value)
+    except ValueError:
+        logger.warning("Invalid TD_LAUNCHER_PREWARM_MB %r, using %s MB", value, prewarm_default_budget_mb)
+        budget_mb = prewarm_default_budget_mb
+    return int(budget_mb * 1024 * 1024)
+
+prewarm_budget_bytes = _parse_prewarm_budget()
+
+def _iter_prewarm_candidates(toe_path, asset_dirs):
+    toe_directory = os.path.dirname(os.path.abspath(toe_path))
+    yield os.path.abspath(toe_path)
+    for asset_dir in asset_dirs:
+        for root, dirs, names in os.walk(os.path.join(toe_directory, asset_dir.strip())):
+            dirs.sort()
+            for name in sorted(names):
+                yield os.path.join(root, name)
+
+def collect_prewarm_files(toe_path, asset_dirs, budget_bytes):
+    # the .toe always comes first and always counts, then asset files in directory order
+    # that still fit in whatever is left of the byte budget.
+    toe_path = os.path.abspath(toe_path)
+    files = []
+    total_bytes = 0
+    for path in _iter_prewarm_candidates(toe_path, asset_dirs):
+        if prewarm_cancel_event.is_set():
+            break
+        # stop walking once there is next to no budget left (the .toe itself is always taken), stat-ing
+        # the rest of a big media tree would only spend the countdown on metadata I/O.
+        if files and budget_bytes - total_bytes < prewarm_min_remaining_bytes:
+            break
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        if path != toe_path and total_bytes + size > budget_bytes:
+            continue
+        files.append((path, size))
+        total_bytes += size
+    return files, total_bytes
+
+def prewarm_file(path, size):
+    if hasattr(os, 'posix_fadvise'):
+        # asynchronous readahead, the kernel does the reading so this returns almost immediately.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+        return
+
+    # no readahead hint on this platform (macOS, Windows), so read the file sequentially and throw the data away.
+    with open(path, 'rb', buffering=0) as f:
+        while not prewarm_cancel_event.is_set():
+            if not f.read(prewarm_chunk_size):
+                break
+
+def _prewarm_worker(file_queue, stats):
+    while not prewarm_cancel_event.is_set():
+        try:
+            path, size = file_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            prewarm_file(path, size)
+            # each worker has its own stats dict, so these don't race.
+            stats['files'] += 1
+            stats['bytes'] += size
+        except OSError as e:
+            logger.debug("prewarm skipped %s: %s", path, e)
+
+def _run_prewarm(toe_path):
+    started = time.time()
+    files, total_bytes = collect_prewarm_files(toe_path, prewarm_dirs, prewarm_budget_bytes)
+    if not files:
+        return
+
+    file_queue = queue.Queue()
+    for f in files:
+        file_queue.put(f)
+    worker_stats = [ { 'files': 0, 'bytes': 0 } for _ in range(min(prewarm_num_workers, len(files))) ]
+
+    workers = [ threading.Thread(target=_prewarm_worker, args=(file_queue, stats), daemon=True) for stats in worker_stats ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    stats = { k: sum(ws[k] for ws in worker_stats) for k in ('files', 'bytes') }
+
+    state = 'cancelled' if prewarm_cancel_event.is_set() else 'done'
+    logger.debug("prewarm %s: %s/%s files, %.1f/%.1f MB in %.2fs", state, stats['files'], len(files), stats['bytes'] / 1048576, total_bytes / 1048576, time.time() - started)
+
+def start_prewarm(toe_path):
+    # daemon threads, so walking the asset directories never blocks the GUI and a prewarm
+    # still in flight never holds up closing the launcher.
+    threading.Thread(target=_run_prewarm, args=(toe_path,), daemon=True).start()
+
+def cancel_prewarm():
+    prewarm_cancel_event.set()
+
+
 # gather and generate some variables.
 # Main execution starts
 
@@ -399,12 +889,10 @@ def generate_td_url(build_option):
 try:
     build_info = inspect_toe_v2()
     build_year = int(build_info.split('.')[1])
-    if DEBUG_MODE:
-        logger.debug(f"TOE file requires TouchDesigner year: {build_year}")
+    logger.debug("TOE file requires TouchDesigner year: %s", build_year)
     
     td_url = generate_td_url(build_info)
-    if DEBUG_MODE:
-        logger.debug(f"Generated download URL: {td_url}")
+    logger.debug("Generated download URL: %s", td_url)
     
     # Cross-platform file path
     td_filename = td_url.split("/")[-1]
@@ -413,18 +901,18 @@ try:
         # On macOS, save next to the TOE file to avoid permission issues
         toe_directory = os.path.dirname(os.path.abspath(td_file_path))
         td_uri = os.path.join(toe_directory, td_filename)
-        logger.debug(f"macOS: Saving download next to TOE file")
-        logger.debug(f"TOE file directory: {toe_directory}")
+        logger.debug("macOS: Saving download next to TOE file")
+        logger.debug("TOE file directory: %s", toe_directory)
     else:  # Windows and other platforms
         # Keep original behavior for Windows
         td_uri = os.path.join(os.getcwd(), td_filename)
-        logger.debug(f"Windows: Using current working directory")
+        logger.debug("Windows: Using current working directory")
     
-    logger.debug(f"Download filename: {td_filename}")
-    logger.debug(f"Local download path: {td_uri}")
+    logger.debug("Download filename: %s", td_filename)
+    logger.debug("Local download path: %s", td_uri)
     
 except Exception as e:
-    logger.error(f"❌ Failed to analyze TOE file: {e}")
+    logger.error("❌ Failed to analyze TOE file: %s", e)
     print(f"❌ Error analyzing TOE file: {e}")
     sys.exit(1)
 
@@ -435,10 +923,12 @@ if platform.system() == 'Windows':
 else:  # Mac/Linux
     td_key_id_dict = query_td_mac_applications()
 
-if DEBUG_MODE:
-    logger.debug(f"Found {len(td_key_id_dict)} TouchDesigner installations")
-    for key, info in td_key_id_dict.items():
-        logger.debug(f"  • {key}: {info.get('executable', 'N/A')}")
+def _describe_installations(td_key_id_dict):
+    return ''.join(f"\n  • {key}: {info.get('executable', 'N/A')}" for key, info in td_key_id_dict.items())
+
+logger.debug("Found %s TouchDesigner installations:%s", len(td_key_id_dict), LazyLogArg(_describe_installations, td_key_id_dict))
+
+launch_profile = load_launch_profile(td_file_path)
 
 # Maintain a stable, ordered list of available versions for keyboard navigation (consistent across OS)
 def _parse_td_key_numeric(key: str):
@@ -452,16 +942,46 @@ def _parse_td_key_numeric(key: str):
 
 version_keys = sorted(list(td_key_id_dict.keys()), key=_parse_td_key_numeric)
 
+# Type-to-filter search over the installed builds. Every key is indexed under each dotted
+# suffix ('touchdesigner.2023.11600', '2023.11600', '11600') so that typing a year or a build
+# number narrows the list, and every prefix of those tokens maps straight to its matches.
+def _version_search_tokens(key: str):
+    parts = key.lower().split('.')
+    return ['.'.join(parts[i:]) for i in range(len(parts))]
+
+def build_version_prefix_index(keys):
+    prefix_index = {}
+    for i, key in enumerate(keys):
+        seen = set()
+        for token in _version_search_tokens(key):
+            for end in range(1, len(token) + 1):
+                prefix = token[:end]
+                if prefix in seen:
+                    continue
+                seen.add(prefix)
+                # keys are visited in order, so every match list stays sorted like version_keys
+                prefix_index.setdefault(prefix, []).append(i)
+    return prefix_index
+
+version_prefix_index = build_version_prefix_index(version_keys)
+
+def filter_version_keys(query: str):
+    query = query.strip().lower()
+    if not query:
+        return list(version_keys)
+    return [version_keys[i] for i in version_prefix_index.get(query, [])]
+
 # Check if we have the required version
 required_version_key = build_info
 if required_version_key in td_key_id_dict:
-    logger.info(f"Required version {required_version_key} is installed")
+    logger.info("Required version %s is installed", required_version_key)
 else:
-    logger.info(f"Required version {required_version_key} not found - will download")
+    logger.info("Required version %s not found - will download", required_version_key)
 
 def cancel_countdown():
     global countdown_enabled
     countdown_enabled = False
+    cancel_prewarm()
 
 def update_download_progress(b=1, bsize=1, tsize=None):
     global download_progress
@@ -504,7 +1024,7 @@ def start_download(sender, app_data):
         # Download success already logged above
     
     except Exception as e:
-        logger.error(f"❌ Download failed: {e}")
+        logger.error("❌ Download failed: %s", e)
         print(f"❌ Download error: {e}")
         dpg.set_value("download_filter", 'd')
 
@@ -514,30 +1034,30 @@ def start_download(sender, app_data):
 def install_touchdesigner_version(sender, app_data):
     logger.info("📦 Starting TouchDesigner installation...")
     logger.info("=" * 50)
-    logger.info(f"💿 Installer file: {td_uri}")
+    logger.info("💿 Installer file: %s", td_uri)
     
     # Platform-specific installation handling
     try:
         if platform.system() == 'Windows':
             # Windows: Run the .exe installer silently
             install_command = [ 'start', '', '/WAIT', td_uri, ]
-            logger.info(f"💻 Windows install command: {' '.join(install_command)}")
+            logger.info("💻 Windows install command: %s", ' '.join(install_command))
             process = subprocess.Popen(install_command, shell = True)
-            logger.info(f"✅ Installer started with PID: {process.pid}")
+            logger.info("✅ Installer started with PID: %s", process.pid)
         else:  # Mac
             # Mac: Open the .dmg file (this will mount it and show in Finder)
             # The user will need to manually drag the app to Applications
             install_command = ['open', td_uri]
-            logger.info(f"🍎 macOS install command: {' '.join(install_command)}")
+            logger.info("🍎 macOS install command: %s", ' '.join(install_command))
             process = subprocess.Popen(install_command)
-            logger.info(f"✅ DMG opened with PID: {process.pid}")
+            logger.info("✅ DMG opened with PID: %s", process.pid)
             logger.info("ℹ️  User will need to manually drag TouchDesigner to Applications folder")
             
         logger.info("🎉 Installation process initiated!")
         logger.info("🔚 Closing TD Launcher...")
         
     except Exception as e:
-        logger.error(f"❌ Installation failed: {e}")
+        logger.error("❌ Installation failed: %s", e)
         print(f"❌ Installation error: {e}")
         return
         
@@ -545,35 +1065,42 @@ def install_touchdesigner_version(sender, app_data):
     return
 
 def launch_toe_with_version(sender, app_data):
-    radio_value = dpg.get_value( "td_version" )
-    executable_path = td_key_id_dict[radio_value]['executable']
+    version_key = selected_version_key
+    if version_key not in td_key_id_dict:
+        logger.warning("No installed version selected, nothing to launch")
+        return
+    executable_path = td_key_id_dict[version_key]['executable']
+    # stop the countdown (and prewarming) first, so a launch that fails isn't retried on every frame.
+    cancel_countdown()
     
     logger.info("🚀 Launching TouchDesigner...")
     logger.info("=" * 50)
-    logger.info(f"🎯 Selected version: {radio_value}")
-    logger.info(f"📄 TOE file: {td_file_path}")
-    logger.info(f"🔧 Executable: {executable_path}")
+    logger.info("🎯 Selected version: %s", version_key)
+    logger.info("📄 TOE file: %s", td_file_path)
+    logger.info("🔧 Executable: %s", executable_path)
     
     try:
-        if platform.system() == 'Windows':
+        if launch_profile:
+            launch_instances_with_profile(executable_path, td_file_path, launch_profile)
+        elif platform.system() == 'Windows':
             open_command = f'"{executable_path}" "{td_file_path}"'
-            logger.info(f"💻 Windows launch command: {open_command}")
+            logger.info("💻 Windows launch command: %s", open_command)
             process = subprocess.Popen(open_command, shell = True)
-            logger.info(f"✅ Process started with PID: {process.pid}")
+            logger.info("✅ Process started with PID: %s", process.pid)
         else:  # Mac
             # On Mac, use 'open' command to launch the app with the file
             # open -a "/Applications/TouchDesigner.app" "file.toe"
-            app_path = td_key_id_dict[radio_value]['app_path']
+            app_path = td_key_id_dict[version_key]['app_path']
             open_command = ['open', '-a', app_path, td_file_path]
-            logger.info(f"🍎 macOS launch command: {' '.join(open_command)}")
+            logger.info("🍎 macOS launch command: %s", ' '.join(open_command))
             process = subprocess.Popen(open_command)
-            logger.info(f"✅ Process started with PID: {process.pid}")
+            logger.info("✅ Process started with PID: %s", process.pid)
             
         logger.info("🎉 TouchDesigner launch initiated successfully!")
         logger.info("🔚 Closing TD Launcher GUI...")
         
     except Exception as e:
-        logger.error(f"❌ Failed to launch TouchDesigner: {e}")
+        logger.error("❌ Failed to launch TouchDesigner: %s", e)
         print(f"❌ Error launching TouchDesigner: {e}")
         return
         
@@ -599,23 +1126,112 @@ def exit_gui():
             logger.info("✅ GUI cleanup completed")
             sys.exit(0)
     except Exception as e:
-        logger.warning(f"GUI cleanup warning: {e}")
+        logger.warning("GUI cleanup warning: %s", e)
         sys.exit(1)
 
+# Virtualized version list: only version_list_visible_rows selectable widgets are ever created,
+# and their labels are rebound to whichever slice of the filtered keys is scrolled into view.
+version_list_visible_rows = 9
+filtered_version_keys = list(version_keys)
+filtered_version_positions = { k:i for i,k in enumerate(filtered_version_keys) }
+selected_version_key = build_info if build_info in filtered_version_positions else None
+selected_version_index = filtered_version_positions.get(selected_version_key, -1)
+version_list_offset = 0
+
+def clamp_version_list_offset(offset: int):
+    max_offset = max(len(filtered_version_keys) - version_list_visible_rows, 0)
+    return max(min(offset, max_offset), 0)
+
+def scroll_selection_into_view():
+    global version_list_offset
+    if selected_version_index < 0:
+        return
+    if selected_version_index < version_list_offset:
+        version_list_offset = selected_version_index
+    elif selected_version_index >= version_list_offset + version_list_visible_rows:
+        version_list_offset = selected_version_index - version_list_visible_rows + 1
+    version_list_offset = clamp_version_list_offset(version_list_offset)
+
+def refresh_version_list():
+    # only touches the fixed pool of rows, so the cost is independent of how many builds are installed.
+    if not dpg.does_item_exist("version_list"):
+        return
+    for row in range(version_list_visible_rows):
+        row_tag = f"version_row_{row}"
+        index = version_list_offset + row
+        if index < len(filtered_version_keys):
+            key = filtered_version_keys[index]
+            dpg.configure_item(row_tag, label=key, user_data=key, show=True)
+            dpg.set_value(row_tag, index == selected_version_index)
+        else:
+            dpg.configure_item(row_tag, user_data=None, show=False)
+
+    num_filtered = len(filtered_version_keys)
+    if num_filtered:
+        first = version_list_offset + 1
+        last = min(version_list_offset + version_list_visible_rows, num_filtered)
+        status = f'{first}-{last} of {num_filtered}'
+    else:
+        status = 'no matches'
+    dpg.set_value("version_list_status", status)
+
+def select_version_index(index: int):
+    global selected_version_index, selected_version_key
+    if not filtered_version_keys:
+        return
+    selected_version_index = index % len(filtered_version_keys)
+    selected_version_key = filtered_version_keys[selected_version_index]
+    scroll_selection_into_view()
+    refresh_version_list()
+
+def on_version_filter_changed(sender, app_data):
+    global filtered_version_keys, filtered_version_positions, selected_version_index, selected_version_key, version_list_offset
+    filtered_version_keys = filter_version_keys(app_data)
+    filtered_version_positions = { k:i for i,k in enumerate(filtered_version_keys) }
+
+    # keep the current selection if it survived the filter, otherwise pick the best (first) match.
+    if selected_version_key in filtered_version_positions:
+        selected_version_index = filtered_version_positions[selected_version_key]
+    elif filtered_version_keys:
+        selected_version_index = 0
+        selected_version_key = filtered_version_keys[0]
+    else:
+        selected_version_index = -1
+        selected_version_key = None
+
+    version_list_offset = 0
+    scroll_selection_into_view()
+    refresh_version_list()
+
+def on_version_row_clicked(sender, app_data, user_data):
+    if user_data in filtered_version_positions:
+        select_version_index(filtered_version_positions[user_data])
+
+def scroll_version_list(num_rows: int):
+    global version_list_offset
+    version_list_offset = clamp_version_list_offset(version_list_offset + num_rows)
+    refresh_version_list()
+
+def on_mouse_wheel(sender, app_data):
+    # app_data is the wheel delta, positive when scrolling up
+    try:
+        if dpg.is_item_hovered("version_list"):
+            scroll_version_list(-int(app_data))
+    except Exception as e:
+        logger.debug("on_mouse_wheel error: %s", e)
+
 # Keyboard navigation and actions
 def move_selection(step: int):
     try:
-        if not version_keys:
+        if not filtered_version_keys:
             return
-        current_value = dpg.get_value("td_version")
-        try:
-            current_index = version_keys.index(current_value)
-        except ValueError:
-            current_index = 0
-        new_index = (current_index + step) % len(version_keys)
-        dpg.set_value("td_version", version_keys[new_index])
+        if selected_version_index < 0:
+            # nothing selected yet, so start from whichever end we are moving away from
+            select_version_index(0 if step > 0 else -1)
+        else:
+            select_version_index(selected_version_index + step)
     except Exception as e:
-        logger.debug(f"move_selection error: {e}")
+        logger.debug("move_selection error: %s", e)
 
 
 def on_key_press(sender, app_data):
@@ -629,6 +1245,10 @@ def on_key_press(sender, app_data):
             move_selection(-1)
         elif key_code == getattr(dpg, 'mvKey_Down', None):
             move_selection(1)
+        elif key_code in (getattr(dpg, 'mvKey_Prior', None), getattr(dpg, 'mvKey_PageUp', None)):
+            move_selection(-version_list_visible_rows)
+        elif key_code in (getattr(dpg, 'mvKey_Next', None), getattr(dpg, 'mvKey_PageDown', None)):
+            move_selection(version_list_visible_rows)
         elif key_code in (
             getattr(dpg, 'mvKey_Enter', None),
             getattr(dpg, 'mvKey_Return', None),
@@ -636,22 +1256,25 @@ def on_key_press(sender, app_data):
             getattr(dpg, 'mvKey_KeypadEnter', None),
         ):
             launch_toe_with_version(sender, app_data)
+        elif key_code == getattr(dpg, 'mvKey_F12', None):
+            dump_log_buffer()
         elif key_code == getattr(dpg, 'mvKey_Escape', None):
             exit_gui()
     except Exception as e:
-        logger.debug(f"on_key_press error: {e}")
+        logger.debug("on_key_press error: %s", e)
 
 # build the UI
 logger.info("🖥️  Initializing GUI...")
-logger.info(f"📄 TOE file to display: {td_file_path}")
-logger.info(f"🔧 Required version: {build_info}")
-logger.info(f"📊 Available versions: {list(td_key_id_dict.keys())}")
+logger.info("📄 TOE file to display: %s", td_file_path)
+logger.info("🔧 Required version: %s", build_info)
+logger.info("📊 Available versions: %s", LazyLogArg(list, td_key_id_dict))
 
 dpg.create_context()
 
 with dpg.handler_registry():
     dpg.add_mouse_click_handler(callback=cancel_countdown)
     dpg.add_key_press_handler(callback=on_key_press)
+    dpg.add_mouse_wheel_handler(callback=on_mouse_wheel)
 
 
 with dpg.window(tag="Primary Window"):
@@ -685,8 +1308,16 @@ with dpg.window(tag="Primary Window"):
 
     dpg.add_separator()
 
-    with dpg.child_window(height=200, width=-1):
-        dpg.add_radio_button(version_keys, default_value=build_info, label='TD Version', tag="td_version", horizontal=False)
+    with dpg.group(horizontal=True):
+        dpg.add_input_text(hint='Type to filter versions (e.g. 2023 or 11600)', tag="version_filter", width=-120, callback=on_version_filter_changed)
+        dpg.add_text('', tag="version_list_status")
+
+    with dpg.child_window(height=200, width=-1, tag="version_list", no_scrollbar=True):
+        for row in range(version_list_visible_rows):
+            dpg.add_selectable(label='', tag=f"version_row_{row}", callback=on_version_row_clicked)
+
+    scroll_selection_into_view()
+    refresh_version_list()
 
     dpg.add_separator()
     dpg.add_button(label=f'Open with selected version in {5} seconds', tag="launch_button", width=-1, height=-1, callback=launch_toe_with_version)
@@ -707,6 +1338,7 @@ if build_info not in list( td_key_id_dict.keys() ):
     logger.info("⏸️  Auto-launch disabled - required version not installed")
 else:
     logger.info("⏰ Auto-launch enabled - will launch in 5 seconds")
+    start_prewarm(td_file_path)
 
 logger.info("🔄 Starting main GUI loop...")
 
@@ -730,7 +1362,7 @@ while dpg.is_dearpygui_running():
         
         # if countdown has ended, start toe
         if num_sec_remaining <= 0:
-            logger.info(f"⏰ Auto-launch timeout reached, launching {build_info}")
+            logger.info("⏰ Auto-launch timeout reached, launching %s", build_info)
             launch_toe_with_version({}, {})
         
     else:
@@ -749,7 +1381,7 @@ else:
         dpg.destroy_context()
         logger.info("✅ GUI context destroyed")
     except Exception as e:
-        logger.warning(f"GUI cleanup warning: {e}")
+        logger.warning("GUI cleanup warning: %s", e)
     
     logger.info("👋 TD Launcher shutdown complete")
     